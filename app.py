@@ -1,8 +1,12 @@
 import streamlit as st
+import hashlib
 import logging
-from src.pdf_processor import extract_text_from_pdf
-from src.summary_generator import generate_summary
-from src.quiz_generator import generate_quiz
+import os
+import tempfile
+import time
+import weakref
+from typing import Optional
+from concurrent.futures import wait
 from src.ui.components import (
     display_interactive_quiz,
     display_summary,
@@ -10,6 +14,12 @@ from src.ui.components import (
     display_error,
 )
 from src.ui.sidebar import create_sidebar
+from src.ollama_client import (
+    get_extraction_executor,
+    get_generation_executor,
+    list_ollama_models,
+    prewarm_connection,
+)
 from assets.styles import apply_all_styles
 import requests
 
@@ -20,6 +30,281 @@ logger = logging.getLogger(__name__)
 # Ollama model configuration
 MODEL_NAME = "llama3:latest"
 
+# Seconds between Ollama availability probes within a session
+OLLAMA_PROBE_TTL = 30
+
+# Seconds to wait for background PDF extraction before giving up on it
+EXTRACTION_TIMEOUT = 180
+
+# Static page markup, built once at import rather than on every rerun.
+# Animations used here are defined in assets.styles.apply_custom_styles.
+_HEADER_HTML = """
+<div class="app-header" style="animation: pulse 2s infinite ease-in-out;">
+    <h1>📚 Quiz & Summary Generator</h1>
+    <p style="color: white; margin-top: 0;">Transform PDFs into knowledge with AI assistance</p>
+</div>
+"""
+
+_INTRO_MD = """
+### 🔍 Process PDF Documents in Seconds
+
+This tool helps you **extract valuable information** from PDFs by:
+
+1. Generating **comprehensive summaries** of the document's content
+2. Creating **interactive quizzes** to test understanding
+3. Supporting **manual text input** for quick summarization
+
+Perfect for students, educators, and professionals working with documents!
+"""
+
+_HERO_HTML = """
+<div style="display: flex; justify-content: center; margin-top: 20px;">
+    <div style="text-align: center; background: linear-gradient(135deg, #9C27B0 0%, #673AB7 100%); 
+                border-radius: 50%; width: 120px; height: 120px; display: flex; 
+                align-items: center; justify-content: center; font-size: 3rem;">
+        📑➡️🧠
+    </div>
+</div>
+"""
+
+_DIVIDER_HTML = "<hr style='margin: 2rem 0; background: linear-gradient(90deg, transparent, #9575CD, transparent);'>"
+
+_UPLOAD_INFO_HTML = """
+<div style="background-color: rgba(149, 117, 205, 0.1); padding: 10px; border-radius: 5px; 
+           border-left: 3px solid #9575CD; margin-top: 25px;">
+    <small>Supported: PDF documents up to 50MB</small>
+</div>
+"""
+
+_SUMMARY_DESCRIPTION_HTML = """
+<div style="margin-bottom: 20px;">
+    Generate a comprehensive summary of the document content. This will extract key information,
+    main points, and important details from the PDF to provide a clear overview.
+</div>
+"""
+
+_QUIZ_DESCRIPTION_HTML = """
+<div style="margin-bottom: 20px;">
+    Create a multiple-choice quiz based on the document content. Test your understanding
+    of the material with questions generated from the key concepts in the PDF.
+</div>
+"""
+
+_EXTRACTING_MESSAGE = "⏳ Reading document content... This may take a moment."
+
+_UNREADABLE_MESSAGE = "Please upload a readable PDF document to continue."
+
+_EXTRACTION_TIMEOUT_MESSAGE = (
+    "Reading the document took too long. Please try a smaller or simpler PDF."
+)
+
+_FOOTER_HTML = """
+<div style="text-align: center; margin-top: 3rem; padding: 1rem; border-top: 1px solid #f0f0f0;">
+    <p style="color: #888; font-size: 0.8rem;">
+        Quiz & Summary Generator | Built with Streamlit and Ollama
+    </p>
+</div>
+"""
+
+
+class _Uncached(Exception):
+    """Carries a failed result out of a cached function so it isn't cached.
+
+    st.cache_data stores return values but never exceptions, so raising this
+    keeps errors (e.g. Ollama being down) from sticking to a cache key.
+    """
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+@st.cache_data(show_spinner=False)
+def _extract_cached(file_digest: str, _pdf_path: str):
+    """Extract PDF text, cached on the uploaded file's digest.
+
+    The path is excluded from Streamlit's argument hashing; the digest
+    from ``_spill_upload`` identifies the file contents instead.
+    """
+    from src.pdf_processor import extract_text_from_pdf
+
+    pdf_content, error = extract_text_from_pdf(_pdf_path)
+    if error:
+        raise _Uncached((None, error))
+    return pdf_content, error
+
+
+def _extract(file_digest: str, pdf_path: str):
+    """Extract PDF text, caching successful extractions only."""
+    try:
+        return _extract_cached(file_digest, pdf_path)
+    except _Uncached as e:
+        return e.result
+
+
+def _remove_file(path: str):
+    """Delete a file if it still exists."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class _TempPDF:
+    """An uploaded PDF spilled to disk.
+
+    The file is deleted on ``release`` or, failing that, when the owning
+    session's state is garbage collected after the session ends.
+    """
+
+    def __init__(self, data):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+            tmp_file.write(data)
+        self.path = tmp_file.name
+        self._finalizer = weakref.finalize(self, _remove_file, self.path)
+
+    def release(self, future=None):
+        """Delete the file, waiting for ``future`` to finish if it is pending."""
+        if future is not None and not future.done():
+            future.add_done_callback(lambda _: self._finalizer())
+        else:
+            self._finalizer()
+
+
+def _reset_document_state():
+    """Forget the extracted text and any results generated from it."""
+    for key in ("pdf_content", "content_hash", "quiz_future"):
+        st.session_state.pop(key, None)
+    st.session_state.summary_text = None
+    st.session_state.quiz_data = None
+
+
+def _discard_upload():
+    """Release the current upload's temp file and forget the upload."""
+    pdf_file = st.session_state.pop("pdf_file", None)
+    pdf_future = st.session_state.pop("pdf_future", None)
+    if pdf_file is not None:
+        pdf_file.release(pdf_future)
+    for key in ("upload_id", "upload_digest", "pdf_future_digest", "pdf_future_t"):
+        st.session_state.pop(key, None)
+
+
+def _spill_upload(uploaded_file) -> str:
+    """Write a new upload to a temp file once and return its BLAKE2b digest.
+
+    Only the temp file is kept in session state, so the raw PDF bytes
+    aren't copied around or held by the background extraction.
+    """
+    if st.session_state.get("upload_id") != uploaded_file.file_id:
+        # The previous upload's file is deleted once its extraction finishes
+        _discard_upload()
+
+        with uploaded_file.getbuffer() as data:
+            st.session_state.pdf_file = _TempPDF(data)
+            st.session_state.upload_digest = hashlib.blake2b(
+                data, digest_size=8
+            ).hexdigest()
+        st.session_state.upload_id = uploaded_file.file_id
+    return st.session_state.upload_digest
+
+
+def _content_hash(content: str) -> str:
+    """Return a short digest identifying a piece of document text."""
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _summary_cache(content_hash: str, _summary: Optional[str] = None) -> str:
+    # Summaries are streamed to the page, so they are generated outside this
+    # function and handed in to be stored. A lookup passes no summary and
+    # raises on a miss, which leaves nothing behind in the cache.
+    if _summary is None:
+        raise _Uncached(None)
+    return _summary
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_quiz(content_hash: str, _content: str, seed: int = 0):
+    from src.quiz_generator import generate_quiz
+
+    quiz_data = generate_quiz(_content)
+    if "error" in quiz_data:
+        raise _Uncached(quiz_data)
+    return quiz_data
+
+
+def cached_quiz(content_hash: str, content: str, seed: int = 0):
+    """Generate a quiz, cached on the content hash and seed.
+
+    Bumping ``seed`` bypasses the cache to produce a fresh set of questions.
+    Failed generations are returned but not cached.
+    """
+    try:
+        return _cached_quiz(content_hash, content, seed=seed)
+    except _Uncached as e:
+        return e.result
+
+
+def _render_summary(
+    content_hash: str, content: str, spinner_message: str
+) -> Optional[str]:
+    """Display the summary for ``content``, streaming it on a cache miss.
+
+    Summaries are shared across sessions through the cache, keyed on the
+    content hash. Returns the summary, or None if generation failed; failed
+    or truncated output is never cached, so the next attempt retries.
+    """
+    from src.summary_generator import generate_summary_stream
+
+    try:
+        summary = _summary_cache(content_hash)
+    except _Uncached:
+        pass
+    else:
+        return display_summary(summary)
+
+    try:
+        # Long documents are condensed chunk by chunk before the first
+        # token arrives, so keep a spinner up
+        with st.spinner(spinner_message):
+            summary = display_summary(generate_summary_stream(content))
+    except Exception as e:
+        display_error(f"Failed to generate summary: {str(e)}")
+        return None
+    return _summary_cache(content_hash, summary)
+
+
+def _probe_ollama():
+    """Return the installed Ollama models, re-probing at most every 30s.
+
+    The result is kept in session state, so reruns in between (and repeated
+    timeouts against a hung server) don't hit Ollama at all.
+    """
+    now = time.monotonic()
+    last = st.session_state.get("ollama_probe_t")
+    if last is None or now - last > OLLAMA_PROBE_TTL:
+        st.session_state.ollama_probe_t = now
+        try:
+            st.session_state.ollama_models = list_ollama_models()
+            st.session_state.ollama_ok = True
+        except (requests.Timeout, requests.RequestException):
+            st.session_state.ollama_models = []
+            st.session_state.ollama_ok = False
+    return st.session_state.ollama_models
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_model():
+    """Load the model in the background, once per server process."""
+    from src.llm_interface import warm_model
+
+    return get_generation_executor().submit(warm_model)
+
+
+def _submit_quiz(content_hash: str, pdf_content: str):
+    """Start quiz generation for a document in the background."""
+    st.session_state.quiz_future = get_generation_executor().submit(
+        cached_quiz, content_hash, pdf_content, seed=st.session_state.quiz_seed
+    )
+
 
 def main():
     """Main Streamlit app function with enhanced UI and sidebar"""
@@ -31,6 +316,11 @@ def main():
         initial_sidebar_state="expanded",  # Show sidebar by default now
     )
 
+    # Open the Ollama connection and pin the model in memory before the
+    # user asks for anything
+    prewarm_connection()
+    _warm_model()
+
     # Initialize session state for dark mode
     if "dark_mode" not in st.session_state:
         st.session_state.dark_mode = False  # Default to light mode
@@ -38,80 +328,39 @@ def main():
     # Apply custom styling with dark mode preference
     apply_all_styles(include_dark_mode=st.session_state.dark_mode)
 
+    # Fetch the installed models and share them with the sidebar
+    ollama_models = _probe_ollama()
+
     # Create sidebar with model info and manual text input
-    create_sidebar(MODEL_NAME)
+    create_sidebar(MODEL_NAME, ollama_models)
 
     # Main content area
     with st.container():
         # Stylish header with pulsing effect
-        st.markdown(
-            """
-        <div class="app-header" style="animation: pulse 2s infinite ease-in-out;">
-            <h1>📚 Quiz & Summary Generator</h1>
-            <p style="color: white; margin-top: 0;">Transform PDFs into knowledge with AI assistance</p>
-        </div>
-        <style>
-        @keyframes pulse {
-            0% { box-shadow: 0 0 0 0 rgba(156, 39, 176, 0.4); }
-            70% { box-shadow: 0 0 0 10px rgba(156, 39, 176, 0); }
-            100% { box-shadow: 0 0 0 0 rgba(156, 39, 176, 0); }
-        }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
         # Enhanced Introduction
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.markdown(
-                """
-            ### 🔍 Process PDF Documents in Seconds
-            
-            This tool helps you **extract valuable information** from PDFs by:
-            
-            1. Generating **comprehensive summaries** of the document's content
-            2. Creating **interactive quizzes** to test understanding
-            3. Supporting **manual text input** for quick summarization
-            
-            Perfect for students, educators, and professionals working with documents!
-            """
-            )
+            st.markdown(_INTRO_MD)
 
         with col2:
             # Add a decorative image/animation
-            st.markdown(
-                """
-            <div style="display: flex; justify-content: center; margin-top: 20px;">
-                <div style="text-align: center; background: linear-gradient(135deg, #9C27B0 0%, #673AB7 100%); 
-                            border-radius: 50%; width: 120px; height: 120px; display: flex; 
-                            align-items: center; justify-content: center; font-size: 3rem;">
-                    📑➡️🧠
-                </div>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
         # Check Ollama availability with better styling
-        try:
-            response = requests.get("http://localhost:11434/api/tags")
-            models = [model["name"] for model in response.json()["models"]]
-            if MODEL_NAME not in models:
-                st.warning(
-                    f"⚠️ Model '{MODEL_NAME}' is not available in Ollama. Pull it using: `ollama pull {MODEL_NAME}`"
-                )
-        except requests.RequestException:
+        if not st.session_state.ollama_ok:
             st.error(
                 "❌ Cannot connect to Ollama API. Make sure it's running on port 11434."
             )
+        elif MODEL_NAME not in [model["name"] for model in ollama_models]:
+            st.warning(
+                f"⚠️ Model '{MODEL_NAME}' is not available in Ollama. Pull it using: `ollama pull {MODEL_NAME}`"
+            )
 
         # Create horizontal line to separate sections
-        st.markdown(
-            "<hr style='margin: 2rem 0; background: linear-gradient(90deg, transparent, #9575CD, transparent);'>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_DIVIDER_HTML, unsafe_allow_html=True)
 
         # File upload section with improved UI
         st.markdown("### 📄 Upload Your Document")
@@ -128,15 +377,7 @@ def main():
 
         with col_upload2:
             # Add an information box
-            st.markdown(
-                """
-            <div style="background-color: rgba(149, 117, 205, 0.1); padding: 10px; border-radius: 5px; 
-                       border-left: 3px solid #9575CD; margin-top: 25px;">
-                <small>Supported: PDF documents up to 50MB</small>
-            </div>
-            """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_UPLOAD_INFO_HTML, unsafe_allow_html=True)
 
         # Process manual text input if requested from sidebar
         if (
@@ -156,12 +397,12 @@ def main():
                         disabled=True,
                     )
 
-                # Generate summary for the manual text
-                with st.spinner("Generating summary from manual text input..."):
-                    summary = generate_summary(manual_text)
-
-                    # Display the summary
-                    display_summary(summary)
+                # Generate and display the summary for the manual text
+                _render_summary(
+                    _content_hash(manual_text),
+                    manual_text,
+                    "Generating summary from manual text input...",
+                )
 
                 # Reset the show flag but keep the text for reference
                 st.session_state.show_manual_summary = False
@@ -169,6 +410,7 @@ def main():
                 st.markdown("<hr style='margin: 2rem 0;'>", unsafe_allow_html=True)
 
         # Process uploaded PDF
+        extracting = False
         if uploaded_file:
             st.success(f"✅ File uploaded successfully: **{uploaded_file.name}**")
 
@@ -179,15 +421,52 @@ def main():
             if "summary_text" not in st.session_state:
                 st.session_state.summary_text = None
 
-            # Process PDF and extract content
-            if "pdf_content" not in st.session_state:
-                with st.spinner("Reading document content... This may take a moment."):
-                    pdf_content, error = extract_text_from_pdf(uploaded_file)
-                    if error:
-                        display_error(error)
-                    elif pdf_content:
-                        st.session_state.pdf_content = pdf_content
-                        content_preview(pdf_content)
+            if "quiz_seed" not in st.session_state:
+                st.session_state.quiz_seed = 0
+
+            # Extract the PDF in the background so the page renders right away
+            file_digest = _spill_upload(uploaded_file)
+            if st.session_state.get("pdf_future_digest") != file_digest:
+                st.session_state.pdf_future_digest = file_digest
+                st.session_state.pdf_future = get_extraction_executor().submit(
+                    _extract, file_digest, st.session_state.pdf_file.path
+                )
+                st.session_state.pdf_future_t = time.monotonic()
+            pdf_future = st.session_state.pdf_future
+            extracting = not pdf_future.done()
+
+            if (
+                extracting
+                and time.monotonic() - st.session_state.pdf_future_t
+                > EXTRACTION_TIMEOUT
+            ):
+                # The worker can't be interrupted, but stop polling for it
+                extracting = False
+                pdf_content, error = None, _EXTRACTION_TIMEOUT_MESSAGE
+            elif extracting:
+                pdf_content, error = None, None
+            else:
+                pdf_content, error = pdf_future.result()
+
+            if error:
+                # Don't let the previous document's results show under this file
+                _reset_document_state()
+                display_error(error)
+            elif pdf_content:
+                st.session_state.pdf_content = pdf_content
+                content_hash = _content_hash(pdf_content)
+
+                # Drop results that belong to a previously uploaded document
+                if st.session_state.get("content_hash") != content_hash:
+                    st.session_state.content_hash = content_hash
+                    st.session_state.summary_text = None
+                    st.session_state.quiz_data = None
+
+                    # Generate the quiz in the background so it is ready (or in
+                    # flight) by the time the user opens the quiz tab
+                    _submit_quiz(content_hash, pdf_content)
+
+                content_preview(pdf_content)
 
             # Create enhanced tabs with icons for different functionalities
             tabs = st.tabs(["📄 **Summary**", "🧩 **Interactive Quiz**"])
@@ -197,149 +476,130 @@ def main():
                 st.markdown("### Document Summary")
 
                 # Add description
-                st.markdown(
-                    """
-                <div style="margin-bottom: 20px;">
-                    Generate a comprehensive summary of the document content. This will extract key information,
-                    main points, and important details from the PDF to provide a clear overview.
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-
-                # Generate Summary button with improved styling
-                generate_col1, generate_col2 = st.columns([1, 3])
-                with generate_col1:
-                    generate_summary_btn = st.button(
-                        "🔍 Generate Summary",
-                        key="gen_summary",
-                        use_container_width=True,
-                    )
-
-                if generate_summary_btn or st.session_state.summary_text:
-                    # Only process if we don't already have summary data
-                    if not st.session_state.summary_text:
-                        with st.spinner(
-                            "Generating comprehensive document summary... This may take a few minutes."
-                        ):
-                            summary = generate_summary(st.session_state.pdf_content)
-                            st.session_state.summary_text = summary
-
-                    # Display the summary with a nice animation
-                    st.markdown(
-                        """
-                    <style>
-                    .summary-container {
-                        animation: fadeInUp 0.6s ease-out;
-                    }
-                    @keyframes fadeInUp {
-                        from { opacity: 0; transform: translateY(20px); }
-                        to { opacity: 1; transform: translateY(0); }
-                    }
-                    </style>
-                    <div class="summary-container">
-                    """,
-                        unsafe_allow_html=True,
-                    )
-
-                    display_summary(st.session_state.summary_text)
+                st.markdown(_SUMMARY_DESCRIPTION_HTML, unsafe_allow_html=True)
+
+                if extracting:
+                    st.info(_EXTRACTING_MESSAGE)
+                elif error:
+                    st.warning(_UNREADABLE_MESSAGE)
+                else:
+                    # Generate Summary button with improved styling
+                    generate_col1, generate_col2 = st.columns([1, 3])
+                    with generate_col1:
+                        generate_summary_btn = st.button(
+                            "🔍 Generate Summary",
+                            key="gen_summary",
+                            use_container_width=True,
+                        )
+
+                    if generate_summary_btn or st.session_state.summary_text:
+                        # Display the summary with a nice animation
+                        st.markdown(
+                            '<div class="summary-container">', unsafe_allow_html=True
+                        )
+
+                        if st.session_state.summary_text:
+                            display_summary(st.session_state.summary_text)
+                        else:
+                            st.session_state.summary_text = _render_summary(
+                                st.session_state.content_hash,
+                                st.session_state.pdf_content,
+                                "Generating comprehensive document summary... This may take a few minutes.",
+                            )
 
-                    st.markdown("</div>", unsafe_allow_html=True)
+                        st.markdown("</div>", unsafe_allow_html=True)
 
             # Quiz Tab
             with tabs[1]:
                 st.markdown("### Interactive Quiz")
 
                 # Add description
-                st.markdown(
-                    """
-                <div style="margin-bottom: 20px;">
-                    Create a multiple-choice quiz based on the document content. Test your understanding
-                    of the material with questions generated from the key concepts in the PDF.
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
-
-                # Generate Quiz button with improved styling
-                quiz_col1, quiz_col2 = st.columns([1, 3])
-                with quiz_col1:
-                    generate_quiz_btn = st.button(
-                        "🧩 Generate Quiz", key="gen_quiz", use_container_width=True
-                    )
-
-                if generate_quiz_btn or st.session_state.quiz_data:
-                    # Only process if we don't already have quiz data
-                    if not st.session_state.quiz_data:
-                        with st.spinner(
-                            "Creating quiz questions... This may take a few minutes."
+                st.markdown(_QUIZ_DESCRIPTION_HTML, unsafe_allow_html=True)
+
+                if extracting:
+                    st.info(_EXTRACTING_MESSAGE)
+                elif error:
+                    st.warning(_UNREADABLE_MESSAGE)
+                else:
+                    # Generate Quiz button with improved styling
+                    quiz_col1, quiz_col2 = st.columns([1, 3])
+                    with quiz_col1:
+                        generate_quiz_btn = st.button(
+                            "🧩 Generate Quiz", key="gen_quiz", use_container_width=True
+                        )
+
+                    if generate_quiz_btn or st.session_state.quiz_data:
+                        # Only process if we don't already have quiz data
+                        if not st.session_state.quiz_data:
+                            with st.spinner(
+                                "Creating quiz questions... This may take a few minutes."
+                            ):
+                                st.session_state.quiz_data = (
+                                    st.session_state.quiz_future.result()
+                                )
+
+                                # Reset user answers for the new quiz
+                                questions = st.session_state.quiz_data.get(
+                                    "questions", []
+                                )
+                                st.session_state.user_answers = [""] * len(questions)
+                                st.session_state.quiz_submitted = False
+                                st.session_state.score = 0
+
+                        # Add animation for quiz display
+                        st.markdown(
+                            '<div class="quiz-container">', unsafe_allow_html=True
+                        )
+
+                        # Display the quiz
+                        display_interactive_quiz(st.session_state.quiz_data)
+
+                        st.markdown("</div>", unsafe_allow_html=True)
+
+                    # Create new quiz button with improved styling
+                    if "quiz_data" in st.session_state and st.session_state.quiz_data:
+                        if st.button(
+                            "🔄 Create New Quiz", key="new_quiz", type="secondary"
                         ):
-                            st.session_state.quiz_data = generate_quiz(
-                                st.session_state.pdf_content
-                            )
-
-                            # Reset user answers for the new quiz
-                            questions = st.session_state.quiz_data.get("questions", [])
-                            st.session_state.user_answers = [""] * len(questions)
+                            # Clear previous quiz data to force regeneration
+                            st.session_state.quiz_data = None
                             st.session_state.quiz_submitted = False
+                            # Reset to empty list first
+                            st.session_state.user_answers = []
                             st.session_state.score = 0
-
-                    # Add animation for quiz display
-                    st.markdown(
-                        """
-                    <style>
-                    .quiz-container {
-                        animation: fadeInRight 0.6s ease-out;
-                    }
-                    @keyframes fadeInRight {
-                        from { opacity: 0; transform: translateX(20px); }
-                        to { opacity: 1; transform: translateX(0); }
-                    }
-                    </style>
-                    <div class="quiz-container">
-                    """,
-                        unsafe_allow_html=True,
-                    )
-
-                    # Display the quiz
-                    display_interactive_quiz(st.session_state.quiz_data)
-
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-                # Create new quiz button with improved styling
-                if "quiz_data" in st.session_state and st.session_state.quiz_data:
-                    if st.button(
-                        "🔄 Create New Quiz", key="new_quiz", type="secondary"
-                    ):
-                        # Clear previous quiz data to force regeneration
-                        st.session_state.quiz_data = None
-                        st.session_state.quiz_submitted = False
-                        st.session_state.user_answers = []  # Reset to empty list first
-                        st.session_state.score = 0
-
-                        # Regenerate quiz
-                        with st.spinner("Generating new quiz questions..."):
-                            st.session_state.quiz_data = generate_quiz(
-                                st.session_state.pdf_content
-                            )
-
-                            # Initialize user_answers with correct length for new quiz
-                            questions = st.session_state.quiz_data.get("questions", [])
-                            st.session_state.user_answers = [""] * len(questions)
-
-                            st.rerun()
+                            st.session_state.quiz_seed += 1  # Bypass the cached quiz
+
+                            # Regenerate quiz
+                            with st.spinner("Generating new quiz questions..."):
+                                _submit_quiz(
+                                    st.session_state.content_hash,
+                                    st.session_state.pdf_content,
+                                )
+                                st.session_state.quiz_data = (
+                                    st.session_state.quiz_future.result()
+                                )
+
+                                # Initialize user_answers with correct length for new quiz
+                                questions = st.session_state.quiz_data.get(
+                                    "questions", []
+                                )
+                                st.session_state.user_answers = [""] * len(questions)
+
+                                st.rerun()
+
+        elif "pdf_file" in st.session_state:
+            # The uploader was cleared; delete the spilled temp file
+            _discard_upload()
+            _reset_document_state()
 
     # Add footer
-    st.markdown(
-        """
-    <div style="text-align: center; margin-top: 3rem; padding: 1rem; border-top: 1px solid #f0f0f0;">
-        <p style="color: #888; font-size: 0.8rem;">
-            Quiz & Summary Generator | Built with Streamlit and Ollama
-        </p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+
+    # Poll the background extraction, rerunning once it has finished
+    if extracting:
+        with st.spinner(_EXTRACTING_MESSAGE):
+            wait([st.session_state.pdf_future], timeout=1.0)
+        st.rerun()
 
 
 if __name__ == "__main__":
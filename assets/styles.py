@@ -168,6 +168,30 @@ def apply_custom_styles():
     .main .block-container {
         animation: fadeIn 0.5s ease-in-out;
     }
+    
+    @keyframes pulse {
+        0% { box-shadow: 0 0 0 0 rgba(156, 39, 176, 0.4); }
+        70% { box-shadow: 0 0 0 10px rgba(156, 39, 176, 0); }
+        100% { box-shadow: 0 0 0 0 rgba(156, 39, 176, 0); }
+    }
+    
+    @keyframes fadeInUp {
+        from { opacity: 0; transform: translateY(20px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    @keyframes fadeInRight {
+        from { opacity: 0; transform: translateX(20px); }
+        to { opacity: 1; transform: translateX(0); }
+    }
+    
+    .summary-container {
+        animation: fadeInUp 0.6s ease-out;
+    }
+    
+    .quiz-container {
+        animation: fadeInRight 0.6s ease-out;
+    }
     </style>
     """,
         unsafe_allow_html=True,
@@ -3,14 +3,15 @@ import json
 import re
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+from .ollama_client import get_http_session, OLLAMA_BASE_URL, STREAM_TIMEOUT
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Ollama API configuration
-OLLAMA_API_URL = "http://localhost:11434/api/generate"
+OLLAMA_API_URL = f"{OLLAMA_BASE_URL}/api/generate"
 MODEL_NAME = "llama3:latest"  
 
 def call_ollama_api(prompt: str, max_retries: int = 3) -> Dict[str, Any]:
@@ -22,24 +23,22 @@ def call_ollama_api(prompt: str, max_retries: int = 3) -> Dict[str, Any]:
         max_retries: Maximum number of retry attempts
         
     Returns:
-        JSON response from Ollama API
+        Dictionary with the complete response text under "response"
         
     Raises:
         Exception: If all retry attempts fail
     """
-    payload = {
-        "model": MODEL_NAME,
-        "prompt": prompt,
-        "stream": False,
-        "temperature": 0.3,  # Slightly increased for better variety in questions
-        "system": "You are a helpful assistant that creates high-quality educational content."
-    }
-
     for attempt in range(max_retries):
         try:
-            response = requests.post(OLLAMA_API_URL, json=payload)
-            response.raise_for_status()
-            return response.json()
+            # Stream under the hood so STREAM_TIMEOUT bounds the wait between
+            # chunks; a non-streaming request sends nothing until it finishes
+            text = "".join(stream_ollama_api(prompt))
+            return {"response": text, "done": True}
+        except requests.ReadTimeout:
+            # The server stopped producing output mid-generation; retrying
+            # would just wait out another stall
+            logger.error("Timed out waiting for the model to produce more output")
+            raise
         except requests.RequestException as e:
             logger.error(f"Request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
             if attempt < max_retries - 1:
@@ -47,6 +46,84 @@ def call_ollama_api(prompt: str, max_retries: int = 3) -> Dict[str, Any]:
             else:
                 raise
 
+def stream_ollama_api(prompt: str) -> Iterator[str]:
+    """
+    Call the Ollama API in streaming mode
+    
+    Args:
+        prompt: The text prompt to send to the model
+        
+    Yields:
+        Response text fragments as the model produces them
+
+    Raises:
+        requests.RequestException: If the request fails
+        RuntimeError: If Ollama reports an error mid-stream or the stream
+            ends before the response is complete
+    """
+    payload = {
+        "model": MODEL_NAME,
+        "prompt": prompt,
+        "stream": True,
+        "temperature": 0.3,
+        "system": "You are a helpful assistant that creates high-quality educational content."
+    }
+
+    start = time.monotonic()
+    last = start
+    with get_http_session().post(
+        OLLAMA_API_URL, json=payload, stream=True, timeout=STREAM_TIMEOUT
+    ) as response:
+        response.raise_for_status()
+        for i, line in enumerate(response.iter_lines()):
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama error: {chunk['error']}")
+
+            now = time.monotonic()
+            if i == 0:
+                logger.info(f"Time to first token: {now - start:.2f}s")
+            else:
+                logger.debug(f"Chunk {i} latency: {(now - last) * 1000:.1f}ms")
+            last = now
+
+            yield chunk.get("response", "")
+            if chunk.get("done"):
+                break
+        else:
+            raise RuntimeError("Ollama stream ended before the response was complete")
+    logger.info(f"Streamed response completed in {time.monotonic() - start:.2f}s")
+
+def warm_model(keep_alive: int = -1) -> bool:
+    """
+    Load the model into memory ahead of the first real request
+    
+    An empty prompt makes Ollama load the model without generating anything.
+    
+    Args:
+        keep_alive: How long Ollama keeps the model loaded; -1 keeps it indefinitely
+        
+    Returns:
+        True if the model was loaded, False otherwise
+    """
+    payload = {
+        "model": MODEL_NAME,
+        "prompt": "",
+        "stream": False,
+        "keep_alive": keep_alive
+    }
+
+    try:
+        response = get_http_session().post(OLLAMA_API_URL, json=payload, timeout=60)
+        response.raise_for_status()
+        logger.info(f"Model {MODEL_NAME} warmed up")
+        return True
+    except requests.RequestException as e:
+        logger.warning(f"Model warm-up failed: {str(e)}")
+        return False
+
 def extract_json_from_text(text: str) -> Dict[str, Any]:
     """
     Extract JSON from text that may contain additional formatting
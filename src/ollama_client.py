@@ -0,0 +1,104 @@
+import requests
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any
+
+# Ollama server configuration
+OLLAMA_BASE_URL = "http://localhost:11434"
+OLLAMA_TAGS_URL = f"{OLLAMA_BASE_URL}/api/tags"
+
+# (connect, read) timeout for availability probes, so a hung Ollama
+# server fails fast instead of blocking the page render
+PROBE_TIMEOUT = (1.0, 2.0)
+
+# (connect, read) timeout for generation requests, which are always streamed;
+# the read timeout bounds the wait for each chunk, so a hung server can't
+# block forever while long generations still run to completion
+STREAM_TIMEOUT = (10.0, 300.0)
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session used for Ollama calls.
+
+    Sharing one session lets repeated Streamlit reruns reuse the same
+    keep-alive connection instead of opening a new one per request.
+    """
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    session.mount(
+        "http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+    )
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def prewarm_connection() -> bool:
+    """
+    Open a pooled connection to Ollama with a cheap HEAD request.
+
+    Runs once per server process, so the first /api/tags probe reuses an
+    already-open keep-alive socket instead of connecting on the render path.
+
+    Returns:
+        True if Ollama answered, False otherwise
+    """
+    try:
+        get_http_session().head(OLLAMA_BASE_URL, timeout=1.0)
+        return True
+    except requests.RequestException:
+        return False
+
+
+@st.cache_resource
+def get_extraction_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor for PDF text extraction.
+
+    Kept apart from the LLM executors so a quick parse never queues behind
+    minutes-long generation requests.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="extract")
+
+
+@st.cache_resource
+def get_generation_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor for background LLM jobs.
+
+    Used for whole-document work such as quiz prefetching and model warm-up.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="generate")
+
+
+@st.cache_resource
+def get_fanout_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor for parallel chunk requests.
+
+    Sized to match OLLAMA_NUM_PARALLEL=4. Tasks on this executor must not
+    submit work to it themselves, so callers on any other thread can block
+    on its results without risking a deadlock.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="fanout")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_ollama_models() -> List[Dict[str, Any]]:
+    """
+    Fetch the list of installed models from the Ollama API.
+
+    The result is cached for 30 seconds so widget interactions don't
+    re-query Ollama on every rerun.
+
+    Returns:
+        List of model dictionaries as returned by /api/tags
+
+    Raises:
+        requests.RequestException: If Ollama cannot be reached
+    """
+    response = get_http_session().get(OLLAMA_TAGS_URL, timeout=PROBE_TIMEOUT)
+    response.raise_for_status()
+    return response.json().get("models", [])
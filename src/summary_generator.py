@@ -1,10 +1,16 @@
 import logging
-from .llm_interface import call_ollama_api
+from typing import Iterator, List
+from .llm_interface import call_ollama_api, stream_ollama_api
+from .ollama_client import get_fanout_executor
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Documents longer than this (roughly 3k tokens) are summarized chunk by
+# chunk in parallel, then the chunk summaries are combined in a final pass
+CHUNK_CHARS = 12_000
+
 def generate_summary_prompt(pdf_content: str) -> str:
     """
     Create a prompt to generate a comprehensive and detailed summary of a document.
@@ -35,6 +41,133 @@ def generate_summary_prompt(pdf_content: str) -> str:
                 the COMPLETE content of the document without reading the original. Leave nothing important out.
                 """
     return prompt
+
+def generate_chunk_summary_prompt(chunk: str) -> str:
+    """
+    Create a prompt to summarize one section of a larger document.
+    """
+    prompt = f"""
+                You are an expert document analyst. The text below is ONE SECTION of a larger document.
+
+                DOCUMENT SECTION:
+                ```
+                {chunk}
+                ```
+
+                Summarize this section in detail, with each point on its own line.
+                Keep every important fact, definition, figure and conclusion.
+                Do not add an introduction or closing remarks.
+                """
+    return prompt
+
+def generate_combined_summary_prompt(chunk_summaries: List[str]) -> str:
+    """
+    Create a prompt to merge section summaries into one comprehensive summary.
+    """
+    sections = "\n\n".join(
+        f"SECTION {i} SUMMARY:\n{summary}" for i, summary in enumerate(chunk_summaries, 1)
+    )
+
+    prompt = f"""
+                You are an expert document analyst tasked with creating a comprehensive and detailed summary.
+                The document was split into sections, and each section has already been summarized below, in order.
+
+                SECTION SUMMARIES:
+                ```
+                {sections}
+                ```
+
+                SUMMARY INSTRUCTIONS:
+                1. Combine the section summaries into ONE EXTREMELY DETAILED summary of the whole document
+                2. Present each point on its own line for maximum clarity and readability
+                3. Cover ALL sections, keeping the order in which they appear
+                4. Merge repeated points, but do not drop ANY important information
+                5. Organize the information in a logical, structured format
+                """
+    return prompt
+
+def summarize_chunk(chunk: str) -> str:
+    """
+    Summarize a single document section
+    
+    Args:
+        chunk: A section of the document text
+        
+    Returns:
+        Summary of the section
+    """
+    response = call_ollama_api(generate_chunk_summary_prompt(chunk))
+    return response.get("response", "")
+
+def split_into_chunks(text: str, max_chars: int = CHUNK_CHARS) -> List[str]:
+    """
+    Split text into chunks of at most max_chars, breaking between lines
+    
+    Line and paragraph breaks are kept intact; only a single line longer
+    than max_chars is cut mid-line.
+    
+    Args:
+        text: Text to split
+        max_chars: Maximum length of each chunk
+        
+    Returns:
+        List of text chunks
+    """
+    chunks = []
+    current = ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+
+        if len(current) + len(line) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += line
+
+    chunks.append(current)
+    # Drop blank runs, e.g. from page breaks, so they never cost an LLM call
+    return [chunk for chunk in chunks if chunk.strip()]
+
+def build_summary_prompt(pdf_content: str) -> str:
+    """
+    Build the final summary prompt, condensing long documents first
+    
+    Short documents are summarized in a single prompt. Long documents are
+    split into chunks that are summarized concurrently (map). If the chunk
+    summaries are still too long for one prompt, they are split and
+    summarized again until they fit, and the final prompt combines them
+    (reduce).
+    
+    Args:
+        pdf_content: Text extracted from PDF
+        
+    Returns:
+        Prompt for the final summary request
+    """
+    if len(pdf_content) <= CHUNK_CHARS:
+        return generate_summary_prompt(pdf_content)
+
+    text = pdf_content
+    while True:
+        chunks = split_into_chunks(text)
+        logger.info(f"Summarizing {len(chunks)} chunks in parallel")
+        chunk_summaries = list(get_fanout_executor().map(summarize_chunk, chunks))
+
+        combined = "\n\n".join(chunk_summaries)
+        if len(combined) <= CHUNK_CHARS:
+            break
+        if len(combined) >= len(text):
+            # Another round would not shrink the text, so stop here
+            logger.warning("Chunk summaries are not getting shorter; combining as is")
+            break
+        text = combined
+
+    return generate_combined_summary_prompt(chunk_summaries)
+
 def generate_summary(pdf_content: str) -> str:
     """
     Generate a summary from PDF content
@@ -46,7 +179,7 @@ def generate_summary(pdf_content: str) -> str:
         Generated summary text
     """
     try:
-        prompt = generate_summary_prompt(pdf_content)
+        prompt = build_summary_prompt(pdf_content)
         response = call_ollama_api(prompt)
 
         if 'response' not in response:
@@ -56,3 +189,23 @@ def generate_summary(pdf_content: str) -> str:
     except Exception as e:
         logger.error(f"Summary generation error: {str(e)}")
         return f"Failed to generate summary: {str(e)}"
+
+def generate_summary_stream(pdf_content: str) -> Iterator[str]:
+    """
+    Generate a summary from PDF content, yielding text as it is produced
+    
+    Args:
+        pdf_content: Text extracted from PDF
+        
+    Yields:
+        Fragments of the generated summary text
+
+    Raises:
+        Exception: If generation fails; text already yielded is incomplete
+    """
+    try:
+        prompt = build_summary_prompt(pdf_content)
+        yield from stream_ollama_api(prompt)
+    except Exception as e:
+        logger.error(f"Summary generation error: {str(e)}")
+        raise
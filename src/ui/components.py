@@ -1,5 +1,5 @@
 import streamlit as st
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, Union
 
 
 def header():
@@ -95,16 +95,25 @@ def tabs_interface(
             st.warning("Please upload a PDF document first to generate a quiz.")
 
 
-def display_summary(summary_text: str):
-    """Display the PDF summary on the Streamlit interface."""
+def display_summary(summary_text: Union[str, Iterator[str]]) -> str:
+    """Display the PDF summary on the Streamlit interface.
+
+    Accepts either the full summary or a stream of text fragments, which is
+    rendered progressively. Returns the complete summary text.
+    """
     st.subheader("Document Summary")
-    st.markdown(summary_text)
+    if isinstance(summary_text, str):
+        st.markdown(summary_text)
+    else:
+        summary_text = st.write_stream(summary_text)
 
     # Add a copy to clipboard button
     if st.button("Copy Summary to Clipboard"):
         st.code(summary_text)
         st.success("Summary copied to clipboard! (Use Ctrl+C to copy the text above)")
 
+    return summary_text
+
 
 def display_interactive_quiz(quiz_data: Dict[str, Any]):
     """Display the interactive quiz on the Streamlit interface."""
@@ -1,26 +1,45 @@
 import streamlit as st
 import requests
 from typing import List, Dict, Any, Optional
+from src.ollama_client import list_ollama_models
 
-def create_sidebar(model_name: str = "llama3:latest"):
-    """Create an informative sidebar with model info and manual text input options."""
+# Static sidebar markup, built once at import rather than on every rerun
+_ABOUT_MD = """
+**PDF Quiz & Summary Generator** helps you quickly extract knowledge from PDF documents.
+
+- 📑 **Generate detailed summaries** of any PDF
+- 🧠 **Create interactive quizzes** to test understanding
+- 📝 **Process manual text input** for quick summaries
+"""
+
+_RESOURCES_MD = """
+- [Ollama Documentation](https://ollama.ai/docs)
+- [PDF Processing Tips](https://streamlit.io/gallery?category=pdf-processing)
+- [Teaching with AI](https://www.unesco.org/en/artificial-intelligence/education)
+"""
+
+_VERSION_HTML = "<div style='text-align: center; color: #888; font-size: 0.8em;'>Version 1.1.0</div>"
+
+_TAG_TPL = '<span style="background-color:#9575CD;color:white;padding:2px 6px;margin-right:5px;border-radius:10px;font-size:0.8em;">{tag}</span>'
+
+def create_sidebar(
+    model_name: str = "llama3:latest", models: Optional[List[Dict[str, Any]]] = None
+):
+    """Create an informative sidebar with model info and manual text input options.
+
+    ``models`` is the already-fetched Ollama model list, if available.
+    """
     
     with st.sidebar:
         st.title("📋 Tools & Info")
         
         # Add collapsible sections for better organization
         with st.expander("ℹ️ About", expanded=True):
-            st.markdown("""
-            **PDF Quiz & Summary Generator** helps you quickly extract knowledge from PDF documents.
-            
-            - 📑 **Generate detailed summaries** of any PDF
-            - 🧠 **Create interactive quizzes** to test understanding
-            - 📝 **Process manual text input** for quick summaries
-            """)
+            st.markdown(_ABOUT_MD)
         
         # Model information section
         with st.expander("🤖 Model Information", expanded=True):
-            model_info = get_model_info(model_name)
+            model_info = get_model_info(model_name, models)
             
             if model_info:
                 st.success(f"✅ Using: **{model_name}**")
@@ -35,9 +54,7 @@ def create_sidebar(model_name: str = "llama3:latest"):
                 # Show model capabilities as tags
                 if "tags" in model_info and model_info["tags"]:
                     st.markdown("**Capabilities:**")
-                    tags_html = ""
-                    for tag in model_info["tags"]:
-                        tags_html += f'<span style="background-color: #9575CD; color: white; padding: 2px 6px; margin-right: 5px; border-radius: 10px; font-size: 0.8em;">{tag}</span>'
+                    tags_html = "".join(_TAG_TPL.format(tag=t) for t in model_info["tags"])
                     st.markdown(f'<div style="margin-top: 5px;">{tags_html}</div>', unsafe_allow_html=True)
             else:
                 st.warning(f"⚠️ Model info unavailable for **{model_name}**")
@@ -65,66 +82,62 @@ def create_sidebar(model_name: str = "llama3:latest"):
                             st.session_state.manual_input_for_summary = manual_text
                             st.success("Text ready for summarization!")
                             st.session_state.show_manual_summary = True
-                            # The actual summarization will be handled in main app
-                            st.rerun()
+                            # The actual summarization will be handled in main app,
+                            # which renders after the sidebar in this same run
 
         # Dark/Light mode toggle (conceptual - actual implementation would need additional work)
         theme_col1, theme_col2 = st.columns(2)
         
         with theme_col1:
-            if st.button("🌙 Dark"):
+            # Only rerun when the theme actually changes
+            if st.button("🌙 Dark") and not st.session_state.dark_mode:
                 st.session_state.dark_mode = True
                 st.rerun()
         
         with theme_col2:
-            if st.button("☀️ Light"):
+            if st.button("☀️ Light") and st.session_state.dark_mode:
                 st.session_state.dark_mode = False
                 st.rerun()
         
         # Helpful resources
         with st.expander("📚 Resources", expanded=False):
-            st.markdown("""
-            - [Ollama Documentation](https://ollama.ai/docs)
-            - [PDF Processing Tips](https://streamlit.io/gallery?category=pdf-processing)
-            - [Teaching with AI](https://www.unesco.org/en/artificial-intelligence/education)
-            """)
+            st.markdown(_RESOURCES_MD)
         
         # Footer with app version
         st.markdown("---")
-        st.markdown(
-            "<div style='text-align: center; color: #888; font-size: 0.8em;'>Version 1.1.0</div>", 
-            unsafe_allow_html=True
-        )
+        st.markdown(_VERSION_HTML, unsafe_allow_html=True)
 
-def get_model_info(model_name: str) -> Optional[Dict[str, Any]]:
+def get_model_info(
+    model_name: str, models: Optional[List[Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
     """
-    Fetch model information from Ollama API.
+    Look up model information in the Ollama model list.
     
     Args:
         model_name: Name of the model to fetch info for
+        models: Already-fetched model list; fetched from Ollama (cached) if None
         
     Returns:
         Dictionary with model information or None if unavailable
     """
-    try:
-        response = requests.get("http://localhost:11434/api/tags")
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Find the requested model in the list
-            for model in data.get("models", []):
-                if model["name"] == model_name:
-                    # Construct a more useful info object
-                    info = {
-                        "name": model_name,
-                        "size": model.get("size", "Unknown"),
-                        "modified_at": model.get("modified_at", "Unknown"),
-                        "parameters": 7_000_000_000,  # Default for llama3:latest (change as needed)
-                        "family": "LLaMA",
-                        "tags": ["Summarization", "Question Answering", "Content Generation"]
-                    }
-                    return info
-        
-        return None
-    except requests.RequestException:
-        return None
\ No newline at end of file
+    if models is None:
+        try:
+            models = list_ollama_models()
+        except (requests.Timeout, requests.RequestException):
+            return None
+
+    # Find the requested model in the list
+    for model in models:
+        if model["name"] == model_name:
+            # Construct a more useful info object
+            info = {
+                "name": model_name,
+                "size": model.get("size", "Unknown"),
+                "modified_at": model.get("modified_at", "Unknown"),
+                "parameters": 7_000_000_000,  # Default for llama3:latest (change as needed)
+                "family": "LLaMA",
+                "tags": ["Summarization", "Question Answering", "Content Generation"]
+            }
+            return info
+    
+    return None